@@ -10,33 +10,144 @@ st.set_page_config(
 )
 
 
-import json
-import networkx as nx
-import matplotlib.pyplot as plt
+import html
+import math
+import orjson
 import textwrap  # For wrapping long labels
-import pandas as pd  # For creating tables in the text section
 
 # -----------------------------------
 # 1) Load JSON Data from File
 # -----------------------------------
-@st.cache_data
+def _validate_royalty_data(data):
+    """Returns a message describing the first malformed node, or None if the data is well-formed."""
+    if not isinstance(data, dict):
+        return "Expected a dictionary at the root."
+    for category, subcategories in data.items():
+        if not isinstance(subcategories, dict):
+            return f"Expected a dictionary for {category}."
+        for subcategory, sub_node in subcategories.items():
+            if not isinstance(sub_node, dict):
+                return f"Expected a dictionary for {category} → {subcategory}."
+            if category.lower() == "ugc":
+                platforms = {key: value for key, value in sub_node.items() if isinstance(value, dict)}
+            else:
+                platforms = {None: sub_node}
+            for platform, platform_node in platforms.items():
+                path = " → ".join(key for key in (category, subcategory, platform) if key)
+                for region, region_node in platform_node.items():
+                    # Strings at this level are the usage explainers.
+                    if isinstance(region_node, str):
+                        continue
+                    if not isinstance(region_node, dict):
+                        return f"Expected a dictionary or text for {path} → {region}."
+                    for role, role_data in region_node.items():
+                        if not isinstance(role_data, dict):
+                            return f"Expected a dictionary for {path} → {region} → {role}."
+                        for right, right_info in role_data.items():
+                            if not isinstance(right_info, dict):
+                                return f"Expected a dictionary for {path} → {region} → {role} → {right}."
+                            for field in ("collected_by", "payee"):
+                                if not isinstance(right_info.get(field, ""), str):
+                                    return f"Expected text for {path} → {region} → {role} → {right} → {field}."
+    return None
+
+# Read-only reference data: cache_resource hands back the same object on
+# every rerun instead of a fresh copy, and validation runs once per process
+# so the code below can rely on the shape without re-checking it.
+@st.cache_resource
 def load_json():
     try:
-        with open("royalties.json", "r") as f:
-            data = json.load(f)
-            if not isinstance(data, dict):
-                st.error("Invalid JSON structure: Expected a dictionary at the root.")
+        with open("royalties.json", "rb") as f:
+            data = orjson.loads(f.read())
+            problem = _validate_royalty_data(data)
+            if problem:
+                st.error(f"Invalid JSON structure: {problem}")
                 return {}
             return data
     except FileNotFoundError:
         st.error("Error: royalties.json file not found. Ensure it's in the correct directory.")
         return {}
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         st.error("Error: royalties.json contains invalid JSON formatting.")
         return {}
 
 ROYALTY_DATA = load_json()
 
+# -----------------------------------
+# 1.1) Index JSON Data by Selection
+# -----------------------------------
+# Every lookup the UI makes is keyed on the sidebar selection
+# (category, subcategory, platform, region[, role]); platform is None
+# outside UGC. Walking the tree once here turns each rerun's nested
+# .get() chains into single dict lookups.
+USAGE_KEY_PREFIX = {"us": "us", "international": "int"}
+
+def _usage_key(region, role):
+    # Always build a region-specific key – no fallback to generic keys.
+    region = region.lower()
+    return f"{USAGE_KEY_PREFIX.get(region, region)}_usage_explainer_{role}"
+
+def _rights_entry(right_key, right_info):
+    return {
+        "Right": right_key,
+        "fully_not_applicable": right_info.get("fully_not_applicable", None),
+        "Collected By": right_info.get("collected_by", ""),
+        "How Received": right_info.get("how_it_is_received", ""),
+        "Est. Rate": right_info.get("estimated_rate", 0.0),
+        "How it's Calculated": right_info.get("how_it_is_calculated", "")
+    }
+
+@st.cache_resource
+def build_indexes():
+    rights_index = {}
+    usage_index = {}
+    details_index = {}
+    sources_index = {}
+    platforms_index = {}
+    regions_index = {}
+    roles_index = {}
+
+    for category, subcategories in ROYALTY_DATA.items():
+        sources_index[category] = tuple(subcategories)
+        for subcategory, sub_node in subcategories.items():
+            if category.lower() == "ugc":
+                # For UGC, the structure is:
+                # ROYALTY_DATA["ugc"][subcategory][platform][region][role]
+                platforms = {key: value for key, value in sub_node.items() if isinstance(value, dict)}
+                platforms_index[(category, subcategory)] = tuple(platforms)
+            else:
+                platforms = {None: sub_node}
+
+            for platform, platform_node in platforms.items():
+                regions = {key: value for key, value in platform_node.items() if isinstance(value, dict)}
+                regions_index[(category, subcategory, platform)] = tuple(regions)
+                for region, region_node in regions.items():
+                    selection = (category, subcategory, platform, region)
+                    roles_index[selection] = tuple(region_node)
+                    master_list = []
+                    publishing_list = []
+                    for role, role_data in region_node.items():
+                        # The usage explainer sits next to the regions, at the
+                        # subcategory level (or platform level for UGC).
+                        usage_key = _usage_key(region, role)
+                        if usage_key in platform_node:
+                            usage_index[selection + (role,)] = platform_node[usage_key]
+                        rights_index[selection + (role,)] = role_data
+                        for right_key, right_info in role_data.items():
+                            entry = _rights_entry(right_key, right_info)
+                            if role == "artist_label":
+                                master_list.append(entry)
+                            elif role == "writer_publisher":
+                                publishing_list.append(entry)
+                    details_index[selection] = (master_list, publishing_list)
+
+    return rights_index, usage_index, details_index, sources_index, platforms_index, regions_index, roles_index
+
+(
+    _RIGHTS_INDEX, _USAGE_INDEX, _DETAILS_INDEX,
+    _SOURCES, _PLATFORMS, _REGIONS, _ROLES
+) = build_indexes()
+
 # -----------------------------------
 # 2) Utility function to wrap labels
 # -----------------------------------
@@ -47,77 +158,101 @@ def wrap_label(label, width=15):
 # -----------------------------------
 # 2.1) Helper to convert keys to friendly text.
 # -----------------------------------
+_FRIENDLY = {
+    "interactive_dsp": "Interactive DSP",
+    "traditional_digital": "Traditional Digital",
+    "non_interactive_services": "Non-Interactive Services",
+    "digital_downloads": "Digital Downloads",
+    "ugc": "User-Generated Content",
+    "non_digital": "Non-Digital",
+    "artist_label": "Artist/Label",
+    "writer_publisher": "Writer/Publisher",
+    "us": "US",
+    "international": "International",
+    "recording_revenues": "Recording Revenues",
+    "neighboring_rights": "Neighboring Rights",
+    "performance": "Performance Rights",
+    "mechanical": "Mechanical Rights",
+    "sync_fees": "Sync Fees",
+    "broadcast_radio_tv": "Broadcast Radio & TV",
+    "restaurants_bars_venues": "Restaurants, Bars & Venues",
+    "live_performances": "Live Performances",
+    "physical_sales": "Physical Sales",
+    "organic": "Organic",
+    "official_library": "Official Library",
+    "youtube": "YouTube",
+    "meta": "Meta",
+    "tiktok": "TikTok",
+    "snapchat": "Snapchat",
+    "twitch": "Twitch"
+}
+
 def friendly_text(key):
-    mapping = {
-        "interactive_dsp": "Interactive DSP",
-        "traditional_digital": "Traditional Digital",
-        "non_interactive_services": "Non-Interactive Services",
-        "digital_downloads": "Digital Downloads",
-        "ugc": "User-Generated Content",
-        "non_digital": "Non-Digital",
-        "artist_label": "Artist/Label",
-        "writer_publisher": "Writer/Publisher",
-        "us": "US",
-        "international": "International",
-        "recording_revenues": "Recording Revenues",
-        "neighboring_rights": "Neighboring Rights",
-        "performance": "Performance Rights",
-        "mechanical": "Mechanical Rights",
-        "sync_fees": "Sync Fees",
-        "broadcast_radio_tv": "Broadcast Radio & TV",
-        "restaurants_bars_venues": "Restaurants, Bars & Venues",
-        "live_performances": "Live Performances",
-        "physical_sales": "Physical Sales",
-        "organic": "Organic",
-        "official_library": "Official Library",
-        "youtube": "YouTube",
-        "meta": "Meta",
-        "tiktok": "TikTok",
-        "snapchat": "Snapchat",
-        "twitch": "Twitch"
-    }
-    return mapping.get(key.lower(), key)
+    # Most keys are already lowercase, so try them as-is before lowercasing.
+    text = _FRIENDLY.get(key)
+    if text is None:
+        text = _FRIENDLY.get(key.lower(), key)
+    return text
 
 # -----------------------------------
 # 3) Function to Generate and Display Flowcharts
 # -----------------------------------
-def generate_flowchart(source, region, role, rights):
-    if not isinstance(rights, dict) or not rights:
-        st.error(f"Unexpected or missing rights data for {friendly_text(role)} in {friendly_text(region)} for {friendly_text(source)}. Skipping flowchart.")
-        return
+@st.cache_resource
+def build_wrapped_labels():
+    """Wraps every string that can appear as a flowchart node, once per process."""
+    nodes = set()
+    for (category, subcategory, platform, region, role), rights in _RIGHTS_INDEX.items():
+        nodes.add(subcategory)
+        nodes.add(role)
+        for right, details in rights.items():
+            nodes.add(right)
+            nodes.add(details.get("collected_by", "").strip())
+            nodes.add(details.get("payee", "").strip())
+    nodes.discard("")
+    return {node: wrap_label(friendly_text(node), width=20) for node in nodes}
+
+_WRAPPED_LABELS = build_wrapped_labels()
+
+def _rights_key(rights):
+    """Reduces a rights dict to the hashable shape the flowchart layout depends on."""
+    return tuple(
+        (
+            right,
+            details.get("collected_by", "").strip(),
+            details.get("payee", "").strip(),
+            "fully_not_applicable" in details
+        )
+        for right, details in rights.items()
+    )
 
-    G = nx.DiGraph()
+# Streamlit re-executes this script on every rerun, so a plain lru_cache would
+# start empty each time; cache_resource keeps the layouts for the process.
+@st.cache_resource(max_entries=256)
+def _layout(source, role, rights_key):
+    """Computes (positions, colors, edges, wrapped_labels) for a flowchart."""
     node_positions = {}
     node_colors = {}
+    edges = []
 
     # Layout parameters
     x_offset = 2  # Horizontal spacing
     y_offset = 2  # Vertical spacing
-    num_rights = len(rights)
+    num_rights = len(rights_key)
     mid_y = -((num_rights - 1) * y_offset) / 2  # center vertically
 
     # Add the source node (using the subcategory name)
-    G.add_node(source)
     source_color = "lightblue"
     node_colors[source] = source_color
     node_positions[source] = (0, mid_y)
 
     # Loop over each right (e.g., "recording_revenues", "neighboring_rights")
-    for i, (right, details) in enumerate(rights.items()):
-        if not isinstance(details, dict):
-            continue
-
-        collected_by = details.get("collected_by", "").strip()
-        payee = details.get("payee", "").strip()
-        is_not_applicable = "fully_not_applicable" in details
-
+    for i, (right, collected_by, payee, is_not_applicable) in enumerate(rights_key):
         if not payee:
             payee = role
 
         right_x = x_offset
         right_y = -i * y_offset
-        G.add_node(right)
-        G.add_edge(source, right)
+        edges.append((source, right))
         node_colors[right] = "red" if is_not_applicable else source_color
         node_positions[right] = (right_x, right_y)
 
@@ -128,144 +263,181 @@ def generate_flowchart(source, region, role, rights):
         payee_x = collected_by_x + x_offset
 
         if collected_by:
-            G.add_node(collected_by)
-            G.add_edge(right, collected_by)
+            edges.append((right, collected_by))
             node_colors[collected_by] = source_color
             node_positions[collected_by] = (collected_by_x, right_y)
 
         if payee:
-            G.add_node(payee)
             if collected_by:
-                G.add_edge(collected_by, payee)
+                edges.append((collected_by, payee))
             else:
-                G.add_edge(right, payee)
+                edges.append((right, payee))
             node_colors[payee] = source_color
             node_positions[payee] = (payee_x, mid_y)
 
-    wrapped_labels = {node: wrap_label(friendly_text(node), width=20) for node in G.nodes()}
-    fig, ax = plt.subplots(figsize=(12, 6))
-    nx.draw(
-        G,
-        pos=node_positions,
-        labels=wrapped_labels,
-        with_labels=True,
-        node_color=[node_colors[n] for n in G.nodes()],
-        edge_color="gray",
-        node_size=2500,
-        font_size=11,
-        font_color="black",
-        verticalalignment="center",
-        arrowsize=20
-    )
-    plt.title(f"{friendly_text(source)} ({friendly_text(region)} - {friendly_text(role)})", fontsize=14)
-    st.pyplot(fig)
+    wrapped_labels = {
+        node: _WRAPPED_LABELS.get(node) or wrap_label(friendly_text(node), width=20)
+        for node in node_positions
+    }
+    return node_positions, node_colors, tuple(edges), wrapped_labels
+
+# SVG geometry, in pixels
+_NODE_RADIUS = 32
+_X_SCALE = 100  # per layout unit
+_Y_SCALE = 45  # per layout unit
+_MARGIN = 80
+_TITLE_HEIGHT = 30
+_LINE_HEIGHT = 14
+
+def _svg_flowchart(nodes, edges, positions, colors, labels, title):
+    """Builds the flowchart as an SVG document string."""
+    xs = [positions[n][0] for n in nodes]
+    ys = [positions[n][1] for n in nodes]
+    min_x, max_y = min(xs), max(ys)
+    width = (max(xs) - min_x) * _X_SCALE + 2 * _MARGIN
+    height = (max_y - min(ys)) * _Y_SCALE + 2 * _MARGIN + _TITLE_HEIGHT
+
+    def to_px(node):
+        # Layout y grows upwards; SVG y grows downwards.
+        x, y = positions[node]
+        return (x - min_x) * _X_SCALE + _MARGIN, (max_y - y) * _Y_SCALE + _MARGIN + _TITLE_HEIGHT
+
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width:g} {height:g}" '
+        f'width="{width:g}" height="{height:g}" font-family="sans-serif">',
+        '<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" '
+        'markerWidth="8" markerHeight="8" orient="auto-start-reverse">'
+        '<path d="M0,0 L10,5 L0,10 z" fill="gray"/></marker></defs>',
+        f'<text x="{width / 2:g}" y="{_TITLE_HEIGHT:g}" text-anchor="middle" font-size="18">{html.escape(title)}</text>',
+    ]
+
+    # Edges first so the arrows sit underneath the nodes; each one is
+    # trimmed to end at the edge of its nodes rather than their centers.
+    for src, dst in edges:
+        x1, y1 = to_px(src)
+        x2, y2 = to_px(dst)
+        length = math.hypot(x2 - x1, y2 - y1) or 1
+        dx = (x2 - x1) / length * _NODE_RADIUS
+        dy = (y2 - y1) / length * _NODE_RADIUS
+        parts.append(
+            f'<line x1="{x1 + dx:.1f}" y1="{y1 + dy:.1f}" x2="{x2 - dx:.1f}" y2="{y2 - dy:.1f}" '
+            'stroke="gray" stroke-width="1.5" marker-end="url(#arrow)"/>'
+        )
+
+    for node in nodes:
+        cx, cy = to_px(node)
+        parts.append(f'<circle cx="{cx:g}" cy="{cy:g}" r="{_NODE_RADIUS}" fill="{colors[node]}"/>')
+        lines = labels[node].split("\n")
+        # Center the block of lines vertically on the node.
+        first_dy = -(len(lines) - 1) / 2 * _LINE_HEIGHT
+        tspans = "".join(
+            f'<tspan x="{cx:g}" dy="{first_dy if i == 0 else _LINE_HEIGHT:g}">{html.escape(line)}</tspan>'
+            for i, line in enumerate(lines)
+        )
+        parts.append(f'<text y="{cy:g}" text-anchor="middle" dominant-baseline="central" font-size="14">{tspans}</text>')
+
+    parts.append("</svg>")
+    return "".join(parts)
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _flowchart_svg(source, region, role, rights_key):
+    """Renders the flowchart to an SVG string; cached on the (source, region, role, rights) selection."""
+    node_positions, node_colors, edges, wrapped_labels = _layout(source, role, rights_key)
+    title = f"{friendly_text(source)} ({friendly_text(region)} - {friendly_text(role)})"
+    return _svg_flowchart(tuple(node_positions), edges, node_positions, node_colors, wrapped_labels, title)
+
+def generate_flowchart(source, region, role, rights):
+    if not rights:
+        st.error(f"Unexpected or missing rights data for {friendly_text(role)} in {friendly_text(region)} for {friendly_text(source)}. Skipping flowchart.")
+        return
+
+    # Keys keep their JSON order, which drives the top-to-bottom order of the chart.
+    st.image(_flowchart_svg(source, region, role, _rights_key(rights)), use_container_width=True)
 
 # -----------------------------------
 # 4) Helpers for Rights Details in Text
 # -----------------------------------
 def get_rights_data(area: str, usage_type: str, location: str, platform: str = None):
-    # For UGC, our JSON structure now is at:
-    # ROYALTY_DATA["ugc"][usage_type][platform][location]
-    if area.lower() == "ugc":
-        if not platform:
-            return [], []
-        data_node = ROYALTY_DATA[area][usage_type].get(platform, {}).get(location, {})
-    else:
-        data_node = ROYALTY_DATA.get(area, {}).get(usage_type, {}).get(location, {})
-
-    master_list = []
-    publishing_list = []
-    if not isinstance(data_node, dict):
-        return master_list, publishing_list
-
-    for role_key, role_data in data_node.items():
-        if not isinstance(role_data, dict):
-            continue
-        for right_key, right_info in role_data.items():
-            if not isinstance(right_info, dict):
-                continue
-            entry = {
-                "Right": right_key,
-                "fully_not_applicable": right_info.get("fully_not_applicable", None),
-                "Collected By": right_info.get("collected_by", ""),
-                "How Received": right_info.get("how_it_is_received", ""),
-                "Est. Rate": right_info.get("estimated_rate", 0.0),
-                "How it's Calculated": right_info.get("how_it_is_calculated", "")
-            }
-            if role_key == "artist_label":
-                master_list.append(entry)
-            elif role_key == "writer_publisher":
-                publishing_list.append(entry)
-    return master_list, publishing_list
+    # For UGC, the rights sit under a platform: ROYALTY_DATA["ugc"][usage_type][platform][location],
+    # so a UGC lookup without a platform finds nothing.
+    return _DETAILS_INDEX.get((area, usage_type, platform, location), ([], []))
+
+_RIGHT_DISPLAY = {
+    k: friendly_text(k)
+    for k in ("recording_revenues", "neighboring_rights", "performance", "mechanical", "sync_fees")
+}
 
 def create_rights_table(data_list, rights_of_interest):
     rights_status = {r: "❌" for r in rights_of_interest}
-    right_mapping = {
-        "recording_revenues": friendly_text("recording_revenues"),
-        "neighboring_rights": friendly_text("neighboring_rights"),
-        "performance": friendly_text("performance"),
-        "mechanical": friendly_text("mechanical"),
-        "sync_fees": friendly_text("sync_fees")
-    }
     for entry in data_list:
-        raw_key = entry["Right"].lower().replace(" ", "_")
-        display_key = right_mapping.get(raw_key, friendly_text(raw_key))
         if entry["fully_not_applicable"]:
             continue
+        raw_key = entry["Right"].lower().replace(" ", "_")
+        if raw_key not in _RIGHT_DISPLAY:
+            continue
         if entry["Collected By"] and not entry["Collected By"].startswith("❌"):
-            rights_status[display_key] = "✅"
-    df = pd.DataFrame({
+            rights_status[_RIGHT_DISPLAY[raw_key]] = "✅"
+    # A plain column dict is enough for st.table; no DataFrame needed.
+    return {
         "Rights": rights_of_interest,
         "Applicable": [rights_status[r] for r in rights_of_interest]
-    })
-    return df
+    }
+
+_RIGHT_HEADING_HTML = "<strong><p style='margin:0;'>{}</p></strong>"
+_NOT_APPLICABLE_HTML = (
+    "<ul style='margin:0; padding-left:20px; list-style-type: disc;'>"
+    "<p><li>{}</li></p>"
+    "</ul>"
+)
+_DETAILS_HTML = """
+<ul style="margin:0; padding-left:20px; list-style-type: disc;">
+  <li><strong>How it's collected:</strong> {}</li>
+  <li><strong>How it's paid:</strong> {}</li>
+  <li><strong>Estimated rate:</strong> {}</li>
+  <li><strong>How it's calculated:</strong> {}</li>
+</ul>
+"""
 
 def display_rights_details(data_list):
     if not data_list:
         st.write("No rights data available for this section.")
         return
 
+    # Build every entry first and send them in a single st.markdown call.
+    parts = []
     for entry in data_list:
-        display_right = friendly_text(entry["Right"])
+        heading = _RIGHT_HEADING_HTML.format(friendly_text(entry["Right"]))
         if entry["fully_not_applicable"]:
-            st.markdown(
-                f"<strong><p style='margin:0;'>{display_right}</p></strong>"
-                f"<ul style='margin:0; padding-left:20px; list-style-type: disc;'>"
-                f"<p><li>{entry['fully_not_applicable']}</li></p>"
-                f"</ul>",
-                unsafe_allow_html=True
-            )
+            parts.append(heading + _NOT_APPLICABLE_HTML.format(entry["fully_not_applicable"]))
         else:
-            st.markdown(f"<strong><p style='margin:0;'>{display_right}</p></strong>", unsafe_allow_html=True)
-            st.markdown(f"""
-<ul style="margin:0; padding-left:20px; list-style-type: disc;">
-  <li><strong>How it's collected:</strong> {entry['Collected By']}</li>
-  <li><strong>How it's paid:</strong> {entry['How Received']}</li>
-  <li><strong>Estimated rate:</strong> {entry['Est. Rate']}</li>
-  <li><strong>How it's calculated:</strong> {entry["How it's Calculated"]}</li>
-</ul>
-""", unsafe_allow_html=True)
+            parts.append(heading)
+            parts.append(_DETAILS_HTML.format(
+                entry["Collected By"],
+                entry["How Received"],
+                entry["Est. Rate"],
+                entry["How it's Calculated"]
+            ))
+    # Blank lines keep each piece its own block, as the separate calls did.
+    st.markdown("\n\n".join(parts), unsafe_allow_html=True)
 
 # -----------------------------------
 # 5) Streamlit UI with Dropdowns, Flowchart, and Rights Details
 # -----------------------------------
 
 st.sidebar.header("Select usage type")
-category = st.sidebar.selectbox("Category", list(ROYALTY_DATA.keys()), format_func=friendly_text)
-subcategory = st.sidebar.selectbox("Source", list(ROYALTY_DATA[category].keys()), format_func=friendly_text)
+category = st.sidebar.selectbox("Category", tuple(_SOURCES), format_func=friendly_text)
+subcategory = st.sidebar.selectbox("Source", _SOURCES[category], format_func=friendly_text)
 
 if category.lower() == "ugc":
     # For UGC, the structure is:
     # ROYALTY_DATA["ugc"][subcategory][platform][region][role]
-    platform_options = [key for key, value in ROYALTY_DATA[category][subcategory].items() if isinstance(value, dict)]
-    platform = st.sidebar.selectbox("Platform", platform_options, format_func=friendly_text)
-    region_options = [key for key, value in ROYALTY_DATA[category][subcategory][platform].items() if isinstance(value, dict)]
-    region = st.sidebar.selectbox("Region", region_options, format_func=friendly_text)
+    platform = st.sidebar.selectbox("Platform", _PLATFORMS[(category, subcategory)], format_func=friendly_text)
+    region = st.sidebar.selectbox("Region", _REGIONS[(category, subcategory, platform)], format_func=friendly_text)
     # Use radio buttons here (instead of selectbox) to match the other options.
-    role = st.sidebar.radio("Role", options=list(ROYALTY_DATA[category][subcategory][platform][region].keys()), format_func=friendly_text)
+    role = st.sidebar.radio("Role", options=_ROLES[(category, subcategory, platform, region)], format_func=friendly_text)
 else:
-    region_options = [key for key, value in ROYALTY_DATA[category][subcategory].items() if isinstance(value, dict)]
-    region = st.sidebar.selectbox("Region", region_options, format_func=friendly_text)
+    platform = None
+    region = st.sidebar.selectbox("Region", _REGIONS[(category, subcategory, platform)], format_func=friendly_text)
     role = st.sidebar.radio(
         "Role",
         options=["artist_label", "writer_publisher"],
@@ -273,6 +445,8 @@ else:
         index=0  # Default to "Artist/Label"
     )
 
+selection = (category, subcategory, platform, region, role)
+
 # Display the current selection chain.
 if category.lower() == "ugc":
     st.markdown(f"### {friendly_text(subcategory)} → {friendly_text(platform)} → {friendly_text(region)} → {friendly_text(role)}")
@@ -280,37 +454,16 @@ else:
     st.markdown(f"### {friendly_text(subcategory)} → {friendly_text(region)} → {friendly_text(role)}")
 
 # Retrieve the rights dictionary and generate the flowchart.
-if category.lower() == "ugc":
-    rights = ROYALTY_DATA[category][subcategory][platform][region].get(role, {})
-    generate_flowchart(subcategory, region, role, rights)
-else:
-    rights = ROYALTY_DATA[category][subcategory][region][role]
-    generate_flowchart(subcategory, region, role, rights)
+rights = _RIGHTS_INDEX.get(selection, {})
+generate_flowchart(subcategory, region, role, rights)
 
 # -----------------------------------
 # Updated Usage Explainer Section
 # -----------------------------------
-# Always build a region-specific key – no fallback to generic keys.
-if region.lower() == "us":
-    usage_key = f"us_usage_explainer_{role}"
-elif region.lower() == "international":
-    usage_key = f"int_usage_explainer_{role}"
-else:
-    usage_key = f"{region.lower()}_usage_explainer_{role}"
-
-if category.lower() == "ugc":
-    # For UGC, the usage explainer is now at the platform level (inside ROYALTY_DATA[ugc][subcategory][platform])
-    usage_text = ROYALTY_DATA[category][subcategory][platform].get(usage_key, "No usage explainer available.")
-else:
-    usage_text = ROYALTY_DATA[category][subcategory].get(usage_key, "No usage explainer available.")
-
-st.markdown(usage_text)
+st.markdown(_USAGE_INDEX.get(selection, "No usage explainer available."))
 
 # Retrieve rights details for display.
-if category.lower() == "ugc":
-    master_list, publishing_list = get_rights_data(category, subcategory, region, platform=platform)
-else:
-    master_list, publishing_list = get_rights_data(category, subcategory, region)
+master_list, publishing_list = get_rights_data(category, subcategory, region, platform=platform)
 
 if role == "artist_label":
     display_rights_details(master_list)